@@ -6,27 +6,63 @@ Usage:
 
 Features:
 - User can input ANY query
-- Agent processes for 60 seconds
-- During processing, user can send NEW query to interrupt
+- Agent streams its response as soon as the task is received
+- While the response is streaming, user can send NEW query to interrupt
 - New query cancels previous task and switches immediately
 - Works for any topic, not hardcoded
 """
 
 import asyncio
+import hashlib
 import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import aclosing
 from datetime import datetime
-from typing import Optional, TypedDict, Annotated
+from typing import TYPE_CHECKING, Optional, TypedDict, Annotated
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, BaseMessage
+from langchain_core.messages import HumanMessage, BaseMessage, RemoveMessage, SystemMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.config import get_stream_writer
 from langgraph.types import interrupt, Command
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
 load_dotenv()
 
+# Streamed output is forwarded to the caller in batches at most this often (seconds),
+# rather than one stream event per token
+STREAM_FLUSH_SECONDS = 0.2
+
+# Follow-up indicators - these suggest it's an addition/adjustment to current task
+FOLLOW_UP_INDICATORS = (
+    "also", "and", "add", "include", "make it", "change it to",
+    "change to", "update", "modify", "adjust", "edit", "expand",
+    "elaborate", "explain more", "more", "further", "additionally",
+)
+# One precompiled prefix alternation instead of a startswith() loop per call
+_FOLLOW_UP_RE = re.compile("|".join(map(re.escape, FOLLOW_UP_INDICATORS)))
+
+# Number of most recent messages kept in the checkpointed history once a task completes
+MESSAGE_WINDOW = 4
+
+# Static part of the generation prompt, sent as its own system block. The block is
+# marked for Anthropic prompt caching, but at ~40 tokens it is far below the minimum
+# cacheable prompt (1024-2048 tokens depending on the model): no cache entry is
+# created and nothing is saved unless these instructions grow past that size.
+GENERATION_INSTRUCTIONS = """Generate the requested content according to the instructions.
+If the user changed their request, focus ONLY on the latest request.
+Be concise and focused on what was requested.
+"""
+
 
 class AgentState(TypedDict):
     """State schema following LangGraph documentation pattern."""
@@ -35,107 +71,256 @@ class AgentState(TypedDict):
     previous_goal: str
     cancelled: bool
     output: str
-    task_started_at: str
-    task_cancelled_at: Optional[str]
+    task_started_at_ns: int  # time.time_ns(); formatted only when displayed
+    task_cancelled_at_ns: Optional[int]
+
+
+def _format_ts(ns: Optional[int]) -> str:
+    """Render a time.time_ns() timestamp as ISO 8601 (only needed for display)."""
+    if ns is None:
+        return "N/A"
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+class DeferredMemorySaver(MemorySaver):
+    """
+    MemorySaver that buffers checkpoints in memory and persists only the latest one.
+    
+    LangGraph checkpoints after every super-step, but this agent only ever resumes from
+    the most recent checkpoint, so intermediate versions are dropped instead of being
+    serialized. Call flush() whenever the graph stops (interrupt or END).
+    
+    multiple_sequential_adjustments/SequentialAdjustmentAgent.py carries a copy
+    (that script runs standalone and can't import this module); keep them in sync.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._pending: dict[str, tuple] = {}
+        self._pending_writes: dict[str, list] = {}
+    
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        # Keep the parent of the first buffered checkpoint - it's the last one actually stored
+        pending = self._pending.get(thread_id)
+        parent_config = pending[0] if pending else config
+        self._pending[thread_id] = (parent_config, checkpoint, metadata)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+    
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        self._pending_writes.setdefault(thread_id, []).append((config, writes, task_id, task_path))
+    
+    def flush(self, thread_id: str) -> None:
+        """Persist the latest buffered checkpoint (and its pending writes) for a thread."""
+        pending = self._pending.pop(thread_id, None)
+        writes = self._pending_writes.pop(thread_id, [])
+        latest_id = None
+        if pending:
+            parent_config, checkpoint, metadata = pending
+            # Intermediate versions were never stored, so write every channel, not just the new ones
+            super().put(parent_config, checkpoint, metadata, checkpoint["channel_versions"])
+            latest_id = checkpoint["id"]
+        for config, channel_writes, task_id, task_path in writes:
+            # Writes against superseded checkpoints are dropped along with them
+            if latest_id is None or config["configurable"]["checkpoint_id"] == latest_id:
+                super().put_writes(config, channel_writes, task_id, task_path)
 
 
 class HITLAgent:
     """Agent that can be interrupted by unsolicited user input."""
     
+    # ChatAnthropic instances shared by every agent in the process, keyed by
+    # (model, api key fingerprint, temperature). The compiled graph stays per
+    # instance: its nodes are bound to this agent's stdin queue and checkpointer.
+    _LLM_CACHE: dict[tuple, "ChatAnthropic"] = {}
+    
     def _is_follow_up(self, new_input: str, current_goal: str) -> bool:
         """
         Determine if new input is a follow-up/adjustment to current task or a new task.
         
         Returns True if it's a follow-up (should be combined), False if it's a new task (should cancel).
         """
-        new_input_lower = new_input.strip().lower()
-        current_goal_lower = current_goal.lower()
-        
-        # Follow-up indicators - these suggest it's an addition/adjustment to current task
-        follow_up_indicators = [
-            "also", "and", "add", "include", "make it", "change it to", 
-            "change to", "update", "modify", "adjust", "edit", "expand",
-            "elaborate", "explain more", "more", "further", "additionally"
-        ]
+        stripped = new_input.strip()
+        word_count = len(stripped.split())
         
         # Check if input starts with follow-up indicators
-        for indicator in follow_up_indicators:
-            if new_input_lower.startswith(indicator):
-                return True
+        if _FOLLOW_UP_RE.match(stripped.lower()):
+            return True
         
         # If input is very short (likely a quick addition), treat as follow-up
-        if len(new_input.strip().split()) <= 5:
+        if word_count <= 5:
             # Check if it doesn't contain a complete sentence/question structure
-            if not any(char in new_input for char in ['?', '!', '.']) and len(new_input.strip()) < 50:
+            if not any(char in new_input for char in ['?', '!', '.']) and len(stripped) < 50:
                 return True
         
         # If input is a complete standalone task (longer, has structure), treat as new task
-        if len(new_input.strip()) > 50 or '?' in new_input or new_input.strip()[0].isupper():
+        if len(stripped) > 50 or '?' in new_input or stripped[0].isupper():
             # Check if it's clearly a new topic (doesn't reference current goal)
             # Simple heuristic: if it's a question or starts with capital, likely new task
-            if new_input.strip()[0].isupper() and len(new_input.strip().split()) > 3:
+            if stripped[0].isupper() and word_count > 3:
                 return False
         
         # Default: if input is short and doesn't start with follow-up words, 
         # but also doesn't look like a complete new task, treat as follow-up
-        return len(new_input.strip().split()) <= 8
+        return word_count <= 8
     
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        temperature: float = 0.7,
+        enable_prompt_cache: bool = True,
+    ):
         api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY must be provided")
         
-        model_name = os.getenv("ANTHROPIC_MODEL", "claude-3-5-haiku-20241022")
-        self.llm = ChatAnthropic(
-            model=model_name,
-            api_key=api_key,
-            temperature=0.7,
-        )
-        self.memory = MemorySaver()
+        self._api_key = api_key
+        self._model_name = os.getenv("ANTHROPIC_MODEL", "claude-3-5-haiku-20241022")
+        self._temperature = temperature
+        self._llm: Optional["ChatAnthropic"] = None  # created by the llm property
+        system_block = {"type": "text", "text": GENERATION_INSTRUCTIONS}
+        if enable_prompt_cache:
+            # Anthropic prompt caching; inert while the block is below the minimum size
+            system_block["cache_control"] = {"type": "ephemeral"}
+        self._system = SystemMessage(content=[system_block])
+        # Any LangGraph checkpointer works (e.g. AsyncSqliteSaver for persistent sessions);
+        # the default keeps checkpoints in RAM and writes only the latest one per pause
+        self.memory = checkpointer if checkpointer is not None else DeferredMemorySaver()
         self.graph = self._build_graph()
+        
+        # Lines typed by the user, fed by a stdin reader thread (see run()).
+        # The event is set while there is unread input so waiting code wakes instantly.
+        self._interrupt_event = asyncio.Event()
+        self._pending_input: deque[str] = deque()
+    
+    @property
+    def llm(self) -> "ChatAnthropic":
+        """
+        The ChatAnthropic client, created on first use.
+        
+        langchain_anthropic pulls in the anthropic SDK and its schemas, which takes
+        longer than everything else at start-up, so it is only imported once there
+        is a task to generate rather than before the first prompt is shown.
+        """
+        if self._llm is None:
+            from langchain_anthropic import ChatAnthropic
+            
+            # Mirrored in SequentialAdjustmentAgent.llm; keep the two in sync.
+            # ChatAnthropic (>= 0.3.16) draws its httpx clients from a process-wide pool, so
+            # every generation in the session reuses the same keep-alive TLS connection
+            key_hash = hashlib.sha256(self._api_key.encode()).hexdigest()
+            key = (self._model_name, key_hash, self._temperature)
+            self._llm = self._LLM_CACHE.get(key)
+            if self._llm is None:
+                self._llm = self._LLM_CACHE[key] = ChatAnthropic(
+                    model=self._model_name,
+                    api_key=self._api_key,
+                    temperature=self._temperature,
+                )
+        return self._llm
+    
+    def _push_input(self, text: str) -> None:
+        """Queue a line typed by the user and wake up anyone waiting for input."""
+        if text and not all(self._pending_input):
+            # A real line supersedes bare Enters still queued; replaying those first
+            # would resume (and at once abort) the old task before reading this one
+            self._pending_input = deque(filter(None, self._pending_input))
+        self._pending_input.append(text)
+        self._interrupt_event.set()
+    
+    def _take_input(self) -> str:
+        """Pop the oldest unread line; clears the event once the queue is drained."""
+        text = self._pending_input.popleft()
+        if not self._pending_input:
+            self._interrupt_event.clear()
+        return text
+    
+    def _has_new_input(self) -> bool:
+        """True if the user has typed something other than a bare Enter."""
+        return any(self._pending_input)
+    
+    def _start_stdin_reader(self) -> None:
+        """Read stdin on a daemon thread so the event loop never blocks on input()."""
+        loop = asyncio.get_running_loop()
+        
+        def reader():
+            while True:
+                line = sys.stdin.readline()
+                if loop.is_closed():
+                    return
+                if not line:
+                    # EOF - behave as if the user asked to quit
+                    loop.call_soon_threadsafe(self._push_input, "exit")
+                    return
+                loop.call_soon_threadsafe(self._push_input, line.strip())
+        
+        threading.Thread(target=reader, daemon=True).start()
+    
+    async def _ainput(self, prompt: str) -> str:
+        """Async replacement for input() backed by the stdin reader thread."""
+        print(prompt, end="", flush=True)
+        await self._interrupt_event.wait()
+        return self._take_input()
     
     def _build_graph(self):
         """Build graph with interrupt capability for unsolicited input."""
         workflow = StateGraph(AgentState)
         
         workflow.add_node("check_input", self._check_for_new_input)
-        workflow.add_node("process", self._process_task)
         workflow.add_node("generate", self._generate_output)
+        workflow.add_node("window_messages", self._window_messages)
         
         workflow.set_entry_point("check_input")
+        # check_input applies any new task in-line, so it always continues straight to generate
+        workflow.add_edge("check_input", "generate")
         workflow.add_conditional_edges(
-            "check_input",
-            self._route_after_check,
+            "generate",
+            self._route_after_generate,
             {
-                "process": "process",
-                "new_task": "check_input",  # Loop back if new task received
+                "check_input": "check_input",  # Generation was interrupted - handle the new input
+                "window_messages": "window_messages",
             }
         )
-        workflow.add_edge("process", "generate")
-        workflow.add_edge("generate", END)
+        workflow.add_edge("window_messages", END)
         
         return workflow.compile(checkpointer=self.memory)
     
-    def _route_after_check(self, state: AgentState) -> str:
-        """Route based on whether new input was received."""
-        if state.get("cancelled", False):
-            return "new_task"  # New task received, re-check
-        return "process"  # Continue with current task
+    def _route_after_generate(self, state: AgentState) -> str:
+        """Go back to check_input if the user typed something while the output was streaming."""
+        if self._has_new_input():
+            return "check_input"
+        return "window_messages"
+    
+    def _window_messages(self, state: AgentState) -> AgentState:
+        """Trim the history to the last MESSAGE_WINDOW messages so checkpoints stay bounded."""
+        messages = state["messages"]
+        if len(messages) <= MESSAGE_WINDOW:
+            return {}
+        # add_messages treats RemoveMessage as a deletion by id
+        return {"messages": [RemoveMessage(id=m.id) for m in messages[:-MESSAGE_WINDOW]]}
     
     def _check_for_new_input(self, state: AgentState) -> AgentState:
         """Check for new unsolicited input - uses interrupt() to pause and check."""
         current_goal = state.get("current_goal", "")
-        messages = state.get("messages", [])
         
         # If this is first run, set initial goal
-        if not current_goal and messages:
-            latest_msg = messages[-1]
-            if isinstance(latest_msg, HumanMessage):
-                state["current_goal"] = latest_msg.content
-                state["task_started_at"] = datetime.now().isoformat()
-                state["cancelled"] = False
-                state["previous_goal"] = ""
-                return state
+        if not current_goal:
+            messages = state["messages"]
+            if messages and isinstance(messages[-1], HumanMessage):
+                return {
+                    "current_goal": messages[-1].content,
+                    "task_started_at_ns": time.time_ns(),
+                    "cancelled": False,
+                    "previous_goal": "",
+                }
         
         # Check for new input using interrupt - this pauses execution
         # During pause, user can send new input which will be returned here
@@ -143,132 +328,94 @@ class HITLAgent:
         new_input = interrupt(prompt)
         
         # If new input received and different from current goal
-        if new_input and new_input.strip() and new_input.strip() != current_goal:
-            # Determine if it's a follow-up adjustment or a new task
-            is_follow_up = self._is_follow_up(new_input.strip(), current_goal)
+        # Updates are returned as deltas: add_messages appends the new message to the history
+        stripped = new_input.strip() if new_input else ""
+        if stripped and stripped != current_goal:
+            msg = HumanMessage(content=stripped)
             
-            if is_follow_up:
+            # Determine if it's a follow-up adjustment or a new task
+            if self._is_follow_up(stripped, current_goal):
                 # Combine with current goal (adjustment/follow-up)
-                combined_goal = f"{current_goal} {new_input.strip()}"
-                print(f"\n[ADJUST] Follow-up received: '{new_input}'")
-                print(f"[UPDATE] Updating task: '{current_goal}' -> '{combined_goal}'")
+                combined_goal = f"{current_goal} {stripped}"
+                # One print per event: a single stdout write/flush instead of one per line
+                print(f"\n[ADJUST] Follow-up received: '{new_input}'\n"
+                      f"[UPDATE] Updating task: '{current_goal}' -> '{combined_goal}'")
                 
-                state["current_goal"] = combined_goal
-                state["cancelled"] = False  # Not cancelled, just adjusted
-                
-                # Add new message
-                if "messages" not in state:
-                    state["messages"] = []
-                state["messages"].append(HumanMessage(content=new_input.strip()))
+                return {
+                    "messages": [msg],
+                    "current_goal": combined_goal,
+                    "cancelled": False,  # Not cancelled, just adjusted
+                }
             else:
                 # New task - cancel previous and switch
-                print(f"\n[INTERRUPT] New task received: '{new_input}'")
-                print(f"[CANCEL] Cancelling previous task: '{current_goal}'")
-                
-                state["previous_goal"] = current_goal
-                state["current_goal"] = new_input.strip()
-                state["cancelled"] = True
-                state["task_cancelled_at"] = datetime.now().isoformat()
-                state["output"] = ""  # Clear previous output
+                print(f"\n[INTERRUPT] New task received: '{new_input}'\n"
+                      f"[CANCEL] Cancelling previous task: '{current_goal}'")
                 
-                # Add new message
-                if "messages" not in state:
-                    state["messages"] = []
-                state["messages"].append(HumanMessage(content=new_input.strip()))
-        else:
-            state["cancelled"] = False
-        
-        return state
+                return {
+                    "messages": [msg],
+                    "previous_goal": current_goal,
+                    "current_goal": stripped,
+                    "cancelled": True,
+                    "task_cancelled_at_ns": time.time_ns(),
+                    "output": "",  # Clear previous output
+                }
+        
+        return {"cancelled": False}
     
-    def _process_task(self, state: AgentState) -> AgentState:
-        """Process the current task - simulate work for 60 seconds with periodic interrupt checks."""
-        goal = state.get("current_goal", "")
-        if not goal:
-            return state
-        
-        print(f"\n[PROCESS] Starting to work on: {goal}")
-        print("[INFO] You can send a new query anytime during the next 60 seconds to interrupt!")
-        
-        # Simulate 60 seconds of work, but check for interrupts periodically
-        # Following documentation pattern: interrupt() pauses, resume with Command(resume=value)
-        work_duration = 60.0
-        check_interval = 10.0  # Check every 10 seconds
-        elapsed = 0.0
-        
-        while elapsed < work_duration:
-            remaining = work_duration - elapsed
-            print(f"[WORK] Processing... ({elapsed:.0f}s / {work_duration:.0f}s elapsed)")
-            
-            # Use interrupt() to pause and allow new input - follows documentation pattern
-            # When resumed with Command(resume=value), that value is returned here
-            new_input = interrupt(f"Working on '{goal[:40]}...' ({elapsed:.0f}s elapsed). Send new task to interrupt, or Enter to continue.")
-            
-            # If new input received and different, check if it's follow-up or new task
-            if new_input and new_input.strip() and new_input.strip() != goal:
-                # Determine if it's a follow-up adjustment or a new task
-                is_follow_up = self._is_follow_up(new_input.strip(), goal)
-                
-                messages = state.get("messages", [])
-                messages.append(HumanMessage(content=new_input.strip()))
-                
-                if is_follow_up:
-                    # Combine with current goal (adjustment/follow-up)
-                    combined_goal = f"{goal} {new_input.strip()}"
-                    print(f"\n[ADJUST] Follow-up received during work: '{new_input}'")
-                    print(f"[UPDATE] Updating task: '{goal}' -> '{combined_goal}'")
-                    
-                    return {
-                        **state,
-                        "current_goal": combined_goal,
-                        "cancelled": False,  # Not cancelled, just adjusted
-                        "messages": messages,
-                    }
-                else:
-                    # New task - cancel and switch
-                    print(f"\n[INTERRUPT] New task received during work: '{new_input}'")
-                    print(f"[CANCEL] Stopping current work on: '{goal}'")
-                    
-                    return {
-                        **state,
-                        "previous_goal": goal,
-                        "current_goal": new_input.strip(),
-                        "cancelled": True,
-                        "task_cancelled_at": datetime.now().isoformat(),
-                        "output": "",
-                        "messages": messages,
-                    }
-            
-            # Simulate work (synchronous sleep - nodes should be sync unless doing async I/O)
-            import time
-            sleep_time = min(check_interval, remaining)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            elapsed += check_interval
-        
-        print(f"\n[COMPLETE] Finished processing: {goal}")
-        return state
-    
-    def _generate_output(self, state: AgentState) -> AgentState:
+    async def _generate_output(self, state: AgentState) -> AgentState:
         """Generate final output based on current goal."""
         goal = state.get("current_goal", "")
         
         if not goal:
-            return state
-        
-        print(f"\n[GENERATE] Generating output for: {goal}")
-        
-        # Create prompt
-        prompt = f"""User request: "{goal}"
-
-Generate the requested content according to the instructions.
-If the user changed their request, focus ONLY on the latest request.
-Be concise and focused on what was requested.
-"""
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+            return {}
+        
+        print(f"\n[GENERATE] Generating output for: {goal}\n"
+              "[INFO] You can send a new query anytime while the output is streaming to interrupt!")
+        
+        # Only the goal varies between calls; the instructions are a separate system block
+        prompt = f'User request: "{goal}"'
+        
+        # The generation itself is the work the user can interrupt: stream the response
+        # and stop early (closing the HTTP stream) if the user types something meanwhile
+        # Text is also forwarded live on the "custom" stream, coalesced every STREAM_FLUSH_SECONDS
+        writer = get_stream_writer()
+        chunks = []
+        unsent_from = 0  # index of the first chunk not yet forwarded
+        last_flush = time.monotonic()
+        async with aclosing(self.llm.astream([self._system, HumanMessage(content=prompt)])) as stream:
+            async for chunk in stream:
+                chunks.append(chunk.content)
+                if self._has_new_input():
+                    print("\n[INTERRUPT] New input received, stopping generation.")
+                    # Discard the partial output; check_input picks up the new input next
+                    return {"output": ""}
+                now = time.monotonic()
+                if now - last_flush >= STREAM_FLUSH_SECONDS:
+                    writer({"output_chunk": "".join(chunks[unsent_from:])})
+                    unsent_from = len(chunks)
+                    last_flush = now
+        
+        if unsent_from < len(chunks):
+            writer({"output_chunk": "".join(chunks[unsent_from:])})
+        return {"output": "".join(chunks)}
+    
+    async def _stream(self, graph_input, config) -> bool:
+        """
+        Drive the graph until it pauses or finishes, echoing streamed output as it arrives.
         
-        state["output"] = response.content
-        return state
+        Returns True if it stopped at an interrupt(), read from the stream's
+        `__interrupt__` update rather than a separate get_state() round-trip.
+        """
+        paused = False
+        async for mode, event in self.graph.astream(graph_input, config, stream_mode=["updates", "custom"]):
+            if mode == "custom":
+                print(event["output_chunk"], end="", flush=True)
+            elif "__interrupt__" in event:
+                paused = True
+        # Graph paused or finished - persist so it can resume
+        if isinstance(self.memory, DeferredMemorySaver):
+            self.memory.flush(config["configurable"]["thread_id"])
+        return paused
     
     async def run(self, thread_id: str = "hitl_session"):
         """Run HITL session."""
@@ -279,59 +426,55 @@ Be concise and focused on what was requested.
         print("=" * 80)
         print("\nInstructions:")
         print("- Enter any query/task for the agent")
-        print("- Agent will process for 60 seconds")
-        print("- During processing, you can send a NEW query to interrupt")
+        print("- Agent starts generating a response right away")
+        print("- While it is generating, you can send a NEW query to interrupt")
         print("- New query will cancel previous task and switch immediately")
         print("- Type 'exit' or 'quit' to stop")
         print("=" * 80)
         print()
         
-        # Get initial input
-        initial_input = input("Enter your first task/query: ").strip()
+        # stdin is read in the background from here on, so input typed while the
+        # output is streaming reaches _generate_output immediately
+        self._start_stdin_reader()
+        initial_input = (await self._ainput("Enter your first task/query: ")).strip()
         
         if not initial_input or initial_input.lower() in ['exit', 'quit']:
             print("Exiting...")
             return
         
-        # Initialize state - following TypedDict pattern from documentation
+        # Initialize state - following TypedDict pattern from documentation.
+        # current_goal is left empty: check_input takes the goal from the first
+        # message and goes straight to generate instead of pausing at interrupt()
         initial_state: AgentState = {
             "messages": [HumanMessage(content=initial_input)],
-            "current_goal": initial_input,
+            "current_goal": "",
             "previous_goal": "",
             "cancelled": False,
             "output": "",
-            "task_started_at": datetime.now().isoformat(),
-            "task_cancelled_at": None,
+            "task_started_at_ns": time.time_ns(),
+            "task_cancelled_at_ns": None,
         }
         
-        self.graph.update_state(config, initial_state)
-        
         # Start processing
         print(f"\n[START] Task: {initial_input}")
         
-        # Run graph - it will pause at interrupt() calls
-        async for event in self.graph.astream(None, config):
-            pass
+        # Run graph with the initial state as input - it will pause at interrupt() calls
+        paused = await self._stream(initial_state, config)
         
         # Handle interrupts - keep resuming until done
-        current_state = self.graph.get_state(config)
-        
-        while current_state.next:
+        while paused:
             # Graph is paused at interrupt() - get user input
-            user_input = input("\n> ").strip()
+            user_input = await self._ainput("\n> ")
             
             if user_input.lower() in ['exit', 'quit']:
                 print("Exiting...")
                 break
             
             # Resume with user input (empty string = continue, non-empty = new task)
-            async for event in self.graph.astream(Command(resume=user_input), config):
-                pass
-            
-            current_state = self.graph.get_state(config)
+            paused = await self._stream(Command(resume=user_input), config)
         
         # Get final results
-        final_state = self.graph.get_state(config)
+        final_state = await self.graph.aget_state(config)
         result = final_state.values
         
         print("\n" + "=" * 80)
@@ -340,6 +483,9 @@ Be concise and focused on what was requested.
         print(f"Previous Goal: {result.get('previous_goal', 'N/A')}")
         print(f"Current Goal: {result.get('current_goal', 'N/A')}")
         print(f"Cancelled: {result.get('cancelled', False)}")
+        print(f"Task Started At: {_format_ts(result.get('task_started_at_ns'))}")
+        if result.get('cancelled', False):
+            print(f"Cancelled At: {_format_ts(result.get('task_cancelled_at_ns'))}")
         print(f"Output Length: {len(result.get('output', ''))} characters")
         print("\nOutput:")
         print("-" * 80)
@@ -352,8 +498,6 @@ async def main():
     try:
         agent = HITLAgent()
         await agent.run()
-    except KeyboardInterrupt:
-        print("\n\nInterrupted by user. Exiting...")
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
@@ -361,4 +505,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Ctrl-C cancels the main task (it is usually awaiting input); asyncio.run()
+    # then raises KeyboardInterrupt here rather than inside main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n\nInterrupted by user. Exiting...")
@@ -25,21 +25,49 @@ You can test with any scenario, for example:
 But nothing is hardcoded for this; it's just one example.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Annotated, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Annotated, List, Optional, Set, TypedDict
 
 from dotenv import load_dotenv
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import AnyMessage, HumanMessage
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, SystemMessage
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import interrupt, Command
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
 load_dotenv()
 
+# Once the history sent to the LLM exceeds this many characters, only the last
+# HISTORY_KEEP_LAST messages are sent and the rest are left out (the final
+# prompt restates the goal and every adjustment anyway).
+HISTORY_CHAR_LIMIT = 4000
+HISTORY_KEEP_LAST = 2
+# Independently of length, at most this many history messages are sent verbatim.
+HISTORY_MAX_MESSAGES = 6
+
+# Static instructions sent ahead of the (growing) history on every generation.
+# Kept constant so it can serve as a prompt-cache prefix; on its own (~50 tokens)
+# it is far below Anthropic's minimum cacheable prompt (1024-2048 tokens by model).
+GENERATION_INSTRUCTIONS = """You are helping the user with a task they may refine over several messages.
+The conversation contains their initial request and any later adjustments; the last
+message states the final task. Produce a single, coherent answer that satisfies
+every requirement in it.
+"""
+
 
 # --------------------------------------------------------------------------------------
 # State
@@ -56,7 +84,10 @@ class SequentialAdjustmentState(TypedDict, total=False):
       - adjustments: list of adjustment strings (in order).
       - adjustment_count: len(adjustments).
       - output: final generated content from the LLM.
-      - created_at / last_updated_at: simple timestamps.
+      - goal_words: lowercased words of current_goal, kept in step with it so
+        _is_adjustment never re-splits the growing goal.
+      - created_at_ns / last_updated_at_ns: time.time_ns() timestamps, formatted
+        only when the final summary is printed.
       - done_collecting: True when user is finished giving adjustments.
     """
 
@@ -66,11 +97,77 @@ class SequentialAdjustmentState(TypedDict, total=False):
     adjustments: List[str]
     adjustment_count: int
     output: str
-    created_at: str
-    last_updated_at: str
+    goal_words: Set[str]
+    created_at_ns: int
+    last_updated_at_ns: int
     done_collecting: bool
 
 
+def _format_ts(ns: Optional[int]) -> str:
+    """Render a time.time_ns() timestamp as UTC ISO 8601 for display."""
+    if ns is None:
+        return "N/A"
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+# --------------------------------------------------------------------------------------
+# Checkpointer
+# --------------------------------------------------------------------------------------
+
+
+class DeferredMemorySaver(MemorySaver):
+    """MemorySaver that buffers checkpoints and persists only the latest one.
+
+    LangGraph checkpoints after every super-step (init_goal, every
+    collect_adjustments pass, generate_output), but a session only ever resumes
+    from the most recent checkpoint. Intermediate versions are dropped instead of
+    being stored; call flush() whenever the graph stops (interrupt or END).
+
+    Copy of DeferredMemorySaver in ../HITL_Agent.py. This script runs on its own
+    from this directory, so it cannot import that one; keep the two in sync.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending: dict[str, tuple] = {}
+        self._pending_writes: dict[str, list] = {}
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        # Keep the parent of the first buffered checkpoint - it's the last one stored
+        pending = self._pending.get(thread_id)
+        parent_config = pending[0] if pending else config
+        self._pending[thread_id] = (parent_config, checkpoint, metadata)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        self._pending_writes.setdefault(thread_id, []).append(
+            (config, writes, task_id, task_path)
+        )
+
+    def flush(self, thread_id: str) -> None:
+        """Persist the latest buffered checkpoint (and its pending writes) for a thread."""
+        pending = self._pending.pop(thread_id, None)
+        writes = self._pending_writes.pop(thread_id, [])
+        latest_id = None
+        if pending:
+            parent_config, checkpoint, metadata = pending
+            # Intermediate versions were never stored, so write every channel
+            super().put(parent_config, checkpoint, metadata, checkpoint["channel_versions"])
+            latest_id = checkpoint["id"]
+        for config, channel_writes, task_id, task_path in writes:
+            # Writes against superseded checkpoints are dropped along with them
+            if latest_id is None or config["configurable"]["checkpoint_id"] == latest_id:
+                super().put_writes(config, channel_writes, task_id, task_path)
+
+
 # --------------------------------------------------------------------------------------
 # Agent
 # --------------------------------------------------------------------------------------
@@ -82,7 +179,23 @@ class SequentialAdjustmentAgent:
     using LangGraph's human-in-the-loop `interrupt()` mechanism.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+    # ChatAnthropic instances shared by every agent in the process (see llm)
+    _LLM_CACHE: dict[tuple, "ChatAnthropic"] = {}
+
+    # Final outputs shared by every agent in the process, keyed by a SHA-256 of
+    # the model and the exact messages sent (see _response_cache_key). Least
+    # recently used entries are evicted beyond RESPONSE_CACHE_SIZE. Off by default:
+    # it only lives as long as the process, and the CLI generates once per run.
+    RESPONSE_CACHE_SIZE = 128
+    _RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: Optional[str] = None,
+        cache_responses: bool = False,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+    ):
         api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY must be set in environment or passed in.")
@@ -91,21 +204,118 @@ class SequentialAdjustmentAgent:
             "ANTHROPIC_MODEL", "claude-3-5-haiku-20241022"
         )
 
-        self.llm = ChatAnthropic(
-            model=model_name,
-            api_key=api_key,
-            temperature=0.3,
+        # Cached answers are only meaningful for deterministic calls, so sample
+        # greedily when the response cache is turned on.
+        self.model_name = model_name
+        self.cache_responses = cache_responses
+        self._temperature = 0.0 if cache_responses else 0.3
+        self._api_key = api_key
+        self._llm: Optional["ChatAnthropic"] = None  # created by the llm property
+
+        # Static prefix for every generation, marked for Anthropic prompt caching.
+        # Too short to be cached by itself; see the initial-request breakpoint in
+        # _generate_output for the case where caching actually applies.
+        self._system = SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": GENERATION_INSTRUCTIONS,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         )
 
-        # LangGraph checkpointer so we can pause/resume (HITL)
-        self.memory = MemorySaver()
+        # LangGraph checkpointer so we can pause/resume (HITL). Any async-capable saver
+        # works, e.g. AsyncSqliteSaver to keep sessions on disk (run() only uses the
+        # async API, which SqliteSaver lacks); the default keeps them in RAM and
+        # stores only the latest checkpoint each time the graph stops
+        self.memory = checkpointer if checkpointer is not None else DeferredMemorySaver()
         self.graph = self._build_graph()
 
+    @property
+    def llm(self) -> "ChatAnthropic":
+        """The ChatAnthropic client, created on first use.
+
+        langchain_anthropic pulls in the anthropic SDK and its schemas, the
+        slowest part of start-up, so it is only imported once there is an output
+        to generate rather than before the first prompt is shown.
+        """
+        if self._llm is None:
+            from langchain_anthropic import ChatAnthropic
+
+            # Same client cache as HITLAgent.llm in ../HITL_Agent.py (keep in sync).
+            # One ChatAnthropic per (model, key, temperature) for the whole process.
+            # Its httpx clients come from langchain-anthropic's process-wide pool
+            # (>= 0.3.16), so every session reuses the same keep-alive connection.
+            key_hash = hashlib.sha256(self._api_key.encode()).hexdigest()
+            key = (self.model_name, key_hash, self._temperature)
+            self._llm = self._LLM_CACHE.get(key)
+            if self._llm is None:
+                self._llm = self._LLM_CACHE[key] = ChatAnthropic(
+                    model=self.model_name,
+                    api_key=self._api_key,
+                    temperature=self._temperature,
+                )
+        return self._llm
+
     # ------------------------------------------------------------------
     # Heuristic: is this new input an *adjustment* or a *new task*?
     # ------------------------------------------------------------------
 
-    def _is_adjustment(self, new_input: str, current_goal: str) -> bool:
+    # Phrases that usually mean "throw away old, start something else"
+    _CANCELLATION_INDICATORS = (
+        "actually",
+        "instead",
+        "forget",
+        "ignore",
+        "cancel",
+        "stop",
+        "scratch that",
+        "never mind",
+        "change to",
+        "switch to",
+        "do this instead",
+        "no wait",
+        "focus on",
+        "just ",
+    )
+
+    # Phrases that usually mean "refine/extend this task"
+    _ADJUSTMENT_INDICATORS = (
+        "also",
+        "and",
+        "add",
+        "include",
+        "update",
+        "modify",
+        "adjust",
+        "edit",
+        "expand",
+        "elaborate",
+        "more",
+        "further",
+        "additionally",
+        "use",
+        "specifically",
+        "with",
+        "implement",
+        "ensure",
+        "make sure",
+        "don't forget",
+        "plus",
+    )
+
+    # Replies that mean "no more adjustments, generate now"
+    _DONE_WORDS = frozenset({"done", "no", "n", "ok", "okay", "continue", "go ahead"})
+
+    # Each list compiled into one anchored alternation, so a single match() call
+    # replaces a loop of startswith() checks. Plain prefixes, like startswith().
+    _CANCELLATION_RE = re.compile("|".join(map(re.escape, _CANCELLATION_INDICATORS)))
+    _ADJUSTMENT_RE = re.compile("|".join(map(re.escape, _ADJUSTMENT_INDICATORS)))
+
+    def _is_adjustment(
+        self, new_input: str, current_goal: str, goal_words: Optional[Set[str]] = None
+    ) -> bool:
         """
         Heuristic to decide whether new_input is an adjustment to the current task
         or a completely new task that should replace it.
@@ -115,78 +325,48 @@ class SequentialAdjustmentAgent:
         - Long inputs that look like fresh standalone tasks, especially with
           low word overlap with the current goal, are treated as new tasks.
         """
+        # Each string is stripped, lowercased and split at most once
         new_input = new_input.strip()
         new_lower = new_input.lower()
-        goal_lower = current_goal.lower().strip()
+        new_word_list = new_lower.split()
+        word_count = len(new_word_list)
 
         # If there is no current goal, treat this as a new task.
-        if not goal_lower:
+        if not current_goal.strip():
             return False
 
         # Phrases that usually mean "throw away old, start something else"
-        cancellation_indicators = [
-            "actually",
-            "instead",
-            "forget",
-            "ignore",
-            "cancel",
-            "stop",
-            "scratch that",
-            "never mind",
-            "change to",
-            "switch to",
-            "do this instead",
-            "no wait",
-            "focus on",
-            "just ",
-        ]
-        for ind in cancellation_indicators:
-            if new_lower.startswith(ind):
-                return False
+        if self._CANCELLATION_RE.match(new_lower):
+            return False
 
         # Phrases that usually mean "refine/extend this task"
-        adjustment_indicators = [
-            "also",
-            "and",
-            "add",
-            "include",
-            "update",
-            "modify",
-            "adjust",
-            "edit",
-            "expand",
-            "elaborate",
-            "more",
-            "further",
-            "additionally",
-            "use",
-            "specifically",
-            "with",
-            "implement",
-            "ensure",
-            "make sure",
-            "don't forget",
-            "plus",
-        ]
-        for ind in adjustment_indicators:
-            if new_lower.startswith(ind):
-                return True
+        if self._ADJUSTMENT_RE.match(new_lower):
+            return True
 
         # Very short inputs are often "quick tweaks"
-        if len(new_input.split()) <= 5 and len(new_input) < 60:
+        if word_count <= 5 and len(new_input) < 60:
             return True
 
         # If there is almost no word overlap with the current goal and the
         # new input is substantial, treat as a new task.
-        goal_words = set(goal_lower.split())
-        new_words = set(new_lower.split())
-        overlap = len(goal_words.intersection(new_words))
-
-        if overlap < 2 and len(new_input.split()) > 8:
-            return False
+        if word_count > 8:
+            if goal_words is None:
+                goal_words = set(current_goal.lower().split())
+            if len(goal_words.intersection(new_word_list)) < 2:
+                return False
 
         # Default bias: short-ish things are adjustments, long are new tasks.
-        return len(new_input.split()) <= 10
+        return word_count <= 10
+
+    def _response_cache_key(self, convo: List[AnyMessage]) -> str:
+        """SHA-256 over the model and the role/content of every message sent."""
+        payload = {
+            "model": self.model_name,
+            "messages": [[m.type, m.content] for m in convo],
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
 
     # ------------------------------------------------------------------
     # Graph definition
@@ -233,22 +413,24 @@ class SequentialAdjustmentAgent:
                     break
 
         if not base_goal:
-            # No usable goal, just return state unchanged
-            return state
+            # No usable goal, leave state unchanged
+            return {}
 
         adjustments = state.get("adjustments", [])
         adjustment_count = len(adjustments)
 
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_ns = time.time_ns()
+        current_goal = base_goal if not adjustments else " ".join([base_goal] + adjustments)
 
+        # Nodes return only the keys they change; LangGraph keeps the rest
         return {
-            **state,
             "base_goal": base_goal,
-            "current_goal": base_goal if not adjustments else " ".join([base_goal] + adjustments),
+            "current_goal": current_goal,
+            "goal_words": set(current_goal.lower().split()),
             "adjustments": adjustments,
             "adjustment_count": adjustment_count,
-            "created_at": state.get("created_at", now_iso),
-            "last_updated_at": now_iso,
+            "created_at_ns": state.get("created_at_ns", now_ns),
+            "last_updated_at_ns": now_ns,
             "done_collecting": False,
         }
 
@@ -265,7 +447,6 @@ class SequentialAdjustmentAgent:
         base_goal = state.get("base_goal", "").strip()
         current_goal = state.get("current_goal", base_goal)
         adjustments = state.get("adjustments", [])
-        messages = state.get("messages", [])
 
         # Ask the human for an adjustment, a new task, or "done".
         prompt = (
@@ -278,47 +459,54 @@ class SequentialAdjustmentAgent:
         )
         user_text = interrupt(prompt)
 
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_ns = time.time_ns()
 
         # If user_text is None or empty => user is done giving adjustments
         if not user_text or not str(user_text).strip():
             return {
-                **state,
                 "done_collecting": True,
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
 
         user_text_str = str(user_text).strip()
         lower = user_text_str.lower()
 
         # If user explicitly says "done" / "no" / "continue"
-        if lower in {"done", "no", "n", "ok", "okay", "continue", "go ahead"}:
+        if lower in self._DONE_WORDS:
             return {
-                **state,
                 "done_collecting": True,
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
 
-        # Add this as a new human message in the history
-        messages.append(HumanMessage(content=user_text_str))
-
         # Decide whether this is an adjustment or a completely new task
-        if self._is_adjustment(user_text_str, current_goal or base_goal):
-            # Adjustment case: append and recompute combined goal
-            adjustments.append(user_text_str)
-            combined_goal = " ".join([base_goal] + adjustments)
+        new_words = set(lower.split())
+        if self._is_adjustment(user_text_str, current_goal or base_goal, state.get("goal_words")):
+            # Re-sent the same adjustment (e.g. thought it didn't register): leave it
+            # out of the history as well as the goal, so the LLM only sees it once
+            if adjustments and adjustments[-1].lower() == lower:
+                print(f"[DUPLICATE] Adjustment already applied: {user_text_str}")
+                return {
+                    "done_collecting": False,
+                    "last_updated_at_ns": now_ns,
+                }
+
+            # Adjustment case: append and extend the combined goal; current_goal is
+            # always base_goal + adjustments, so there's no need to re-join them all
+            adjustments = adjustments + [user_text_str]
+            combined_goal = f"{current_goal} {user_text_str}" if current_goal else user_text_str
 
             print(f"[ADJUSTMENT #{len(adjustments)}] {user_text_str}")
             print(f"[UPDATED GOAL] {combined_goal}")
 
+            # New human message for the history; add_messages appends it
             return {
-                **state,
-                "messages": messages,
+                "messages": [HumanMessage(content=user_text_str)],
                 "adjustments": adjustments,
                 "adjustment_count": len(adjustments),
                 "current_goal": combined_goal,
+                "goal_words": state.get("goal_words", set()) | new_words,
                 "done_collecting": False,  # keep collecting until user says done
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
         else:
             # New task: reset adjustments and treat this as a fresh base_goal
@@ -326,14 +514,14 @@ class SequentialAdjustmentAgent:
             print("[RESET] Previous task is replaced by this new task.")
 
             return {
-                **state,
-                "messages": messages,
+                "messages": [HumanMessage(content=user_text_str)],
                 "base_goal": user_text_str,
                 "current_goal": user_text_str,
+                "goal_words": new_words,
                 "adjustments": [],
                 "adjustment_count": 0,
                 "done_collecting": False,
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
 
     def _route_after_collect(self, state: SequentialAdjustmentState) -> str:
@@ -342,7 +530,7 @@ class SequentialAdjustmentAgent:
             return "generate"
         return "more"
 
-    def _generate_output(
+    async def _generate_output(
         self, state: SequentialAdjustmentState
     ) -> SequentialAdjustmentState:
         """
@@ -354,7 +542,7 @@ class SequentialAdjustmentAgent:
         messages = state.get("messages", [])
 
         if not current_goal:
-            return state
+            return {}
 
         print("\n[GENERATE] Creating final output using all requirements...")
         print(f"- Base goal: {base_goal}")
@@ -363,9 +551,51 @@ class SequentialAdjustmentAgent:
             for i, adj in enumerate(adjustments, start=1):
                 print(f"  {i}. {adj}")
 
-        if adjustments:
-            adjustments_text = "\n".join(f"- {a}" for a in adjustments)
-            final_prompt = f"""You are helping the user with an evolving task.
+        # Static instructions first, then the conversation history for
+        # context, then the final summarizing prompt (built last, and only when
+        # needed), which changes every time.
+        system, history = self._system, messages
+        keep = len(messages)
+        if sum(len(str(m.content)) for m in messages) > HISTORY_CHAR_LIMIT:
+            keep = min(keep, HISTORY_KEEP_LAST)
+        keep = min(keep, HISTORY_MAX_MESSAGES)
+        if keep < len(messages):
+            # The final prompt already restates the goal and every adjustment, so
+            # older turns are only context and are dropped outright; a summary of
+            # them would just repeat what the final prompt says. The initial request
+            # goes too, and with it the cache breakpoint set on it below, so a
+            # trimmed request has no cacheable prefix beyond the instructions.
+            history = messages[-keep:]
+        elif messages and isinstance(messages[0], HumanMessage) and isinstance(
+            messages[0].content, str
+        ):
+            # Second cache breakpoint right after the initial request. Anthropic only
+            # caches once the prefix up to it reaches the minimum size (1024-2048
+            # tokens by model), so this only pays off for a long initial request
+            # (e.g. a pasted spec); a later request starting from the same task then
+            # reuses instructions + goal even when its adjustments differ. Shorter
+            # prefixes are sent uncached. Adjustments are never put in cached blocks.
+            first = messages[0]
+            history = [
+                HumanMessage(
+                    content=[
+                        {
+                            "type": "text",
+                            "text": first.content,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                    id=first.id,
+                )
+            ] + messages[1:]
+        if not adjustments and len(messages) == 1:
+            # The initial request is the whole session: send it as-is
+            # rather than building a wrapper prompt that would only restate it
+            convo = [system] + history
+        else:
+            if adjustments:
+                adjustments_text = "\n".join(["- " + a for a in adjustments])
+                final_prompt = f"""You are helping the user with an evolving task.
 
 Initial user request:
 \"\"\"{base_goal}\"\"\"
@@ -380,50 +610,101 @@ Now produce a single, coherent final answer that:
 - Fully satisfies the initial request, AND
 - Incorporates **all** of the adjustments above.
 """
-        else:
-            final_prompt = f"""User request:
+            else:
+                final_prompt = f"""User request:
 \"\"\"{current_goal}\"\"\"
 
 Produce the best possible answer that follows these instructions.
 """
 
-        # Use the entire conversation history for context, plus this final summarizing prompt.
-        convo = messages + [HumanMessage(content=final_prompt)]
+            convo = [system] + history + [HumanMessage(content=final_prompt)]
 
-        now_iso = datetime.now(timezone.utc).isoformat()
+        now_ns = time.time_ns()
+
+        cache_key = self._response_cache_key(convo) if self.cache_responses else None
+        cached = self._RESPONSE_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._RESPONSE_CACHE.move_to_end(cache_key)
+            print("[CACHE] Reusing the output of an identical earlier request.")
+            return {
+                "messages": [AIMessage(content=cached)],
+                "output": cached,
+                "last_updated_at_ns": now_ns,
+            }
 
         try:
-            response = self.llm.invoke(convo)
-            output = response.content
+            # Stream the answer so the user sees it as it is written
+            print()
+            chunks = []
+            async for chunk in self.llm.astream(convo):
+                print(chunk.content, end="", flush=True)
+                chunks.append(chunk.content)
+            print()
+            output = "".join(chunks)
+            response = AIMessage(content=output)
+            if cache_key:
+                self._RESPONSE_CACHE[cache_key] = output
+                if len(self._RESPONSE_CACHE) > self.RESPONSE_CACHE_SIZE:
+                    self._RESPONSE_CACHE.popitem(last=False)
 
             # Add assistant message to history as well
-            messages.append(response)
-
             return {
-                **state,
-                "messages": messages,
+                "messages": [response],
                 "output": output,
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
         except Exception as e:
             err_msg = f"Error generating output: {e}"
             print(err_msg)
             return {
-                **state,
                 "output": err_msg,
-                "last_updated_at": now_iso,
+                "last_updated_at_ns": now_ns,
             }
 
+    def _persist(self, thread_id: str) -> None:
+        """Write out buffered checkpoints once the graph has stopped (interrupt or END)."""
+        if isinstance(self.memory, DeferredMemorySaver):
+            self.memory.flush(thread_id)
+
     # ------------------------------------------------------------------
     # CLI Runner using official `interrupt` + `Command(resume=...)` pattern
     # ------------------------------------------------------------------
 
-    def run(self, thread_id: str = "sequential_adjustments_session"):
+    def _start_stdin_reader(self) -> None:
+        """Read stdin on a daemon thread so the event loop never blocks on input().
+
+        A blocked daemon thread doesn't hold up interpreter exit, unlike an
+        asyncio.to_thread(input) worker, which asyncio.run() waits for on Ctrl-C.
+        """
+        loop = asyncio.get_running_loop()
+        self._lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+        def reader():
+            while True:
+                line = sys.stdin.readline()
+                if loop.is_closed():
+                    return
+                # None marks EOF; _ainput raises EOFError for it, as input() would
+                loop.call_soon_threadsafe(self._lines.put_nowait, line or None)
+                if not line:
+                    return
+
+        threading.Thread(target=reader, daemon=True).start()
+
+    async def _ainput(self, prompt: str) -> str:
+        """Async replacement for input() backed by the stdin reader thread."""
+        print(prompt, end="", flush=True)
+        line = await self._lines.get()
+        if line is None:
+            raise EOFError("EOF when reading a line")
+        return line.rstrip("\n")
+
+    async def run(self, thread_id: str = "sequential_adjustments_session"):
         """
         Run a single sequential-adjustment session via CLI.
 
         Pattern:
-        - First call `graph.stream` with the initial user message.
+        - First call `graph.astream` with the initial user message.
         - The graph stops at `interrupt`.
         - While `state.next` is not empty, we resume with `Command(resume=...)`.
         - When finished, we inspect final state and print summary.
@@ -439,7 +720,9 @@ Produce the best possible answer that follows these instructions.
         print("- Type 'done' (or just press Enter) when you're finished adjusting.")
         print("- Type 'exit' or 'quit' at any prompt to stop.\n")
 
-        initial = input("Initial task: ").strip()
+        # stdin is read on a daemon thread so the event loop stays free while waiting
+        self._start_stdin_reader()
+        initial = (await self._ainput("Initial task: ")).strip()
         if not initial or initial.lower() in {"exit", "quit"}:
             print("Exiting.")
             return
@@ -447,34 +730,38 @@ Produce the best possible answer that follows these instructions.
         # Kick off the graph with the initial user message
         initial_messages = [HumanMessage(content=initial)]
 
-        for _ in self.graph.stream(
+        async for _ in self.graph.astream(
             {"messages": initial_messages}, config, stream_mode="values"
         ):
             # We don't need per-event printing here; we're just driving the state machine.
             pass
+        self._persist(thread_id)
 
         # Now handle any interrupts (multiple sequential adjustments)
         while True:
-            state = self.graph.get_state(config)
+            state = await self.graph.aget_state(config)
             # If there is no "next", the graph has finished
             if not state.next:
                 break
 
             # Graph is paused at interrupt() and expects human input
-            user_input = input("\nAdjustment / new task / 'done': ").strip()
+            user_input = (
+                await self._ainput("\nAdjustment / new task / 'done': ")
+            ).strip()
 
             if user_input.lower() in {"exit", "quit"}:
                 print("Exiting.")
                 return
 
             # Resume execution using LangGraph's official pattern
-            for _ in self.graph.stream(
+            async for _ in self.graph.astream(
                 Command(resume=user_input), config, stream_mode="values"
             ):
                 pass
+            self._persist(thread_id)
 
         # Final state
-        final_state = self.graph.get_state(config).values
+        final_state = (await self.graph.aget_state(config)).values
 
         base_goal = final_state.get("base_goal", "")
         current_goal = final_state.get("current_goal", "")
@@ -489,6 +776,8 @@ Produce the best possible answer that follows these instructions.
         print(f"Base goal:          {base_goal}")
         print(f"Final combined goal:{current_goal}")
         print(f"Total adjustments:  {adjustment_count}")
+        print(f"Started at:         {_format_ts(final_state.get('created_at_ns'))}")
+        print(f"Last updated at:    {_format_ts(final_state.get('last_updated_at_ns'))}")
         if adjustments:
             print("Adjustments (in order):")
             for idx, adj in enumerate(adjustments, 1):
@@ -514,12 +803,10 @@ Produce the best possible answer that follows these instructions.
 # --------------------------------------------------------------------------------------
 
 
-def main():
+async def main():
     try:
         agent = SequentialAdjustmentAgent()
-        agent.run()
-    except KeyboardInterrupt:
-        print("\nInterrupted by user. Exiting...")
+        await agent.run()
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
@@ -528,4 +815,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Ctrl-C cancels the main task (e.g. while it awaits input() in a worker
+    # thread); asyncio.run() then raises KeyboardInterrupt here, not in main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted by user. Exiting...")